@@ -1,12 +1,13 @@
 """FastXE pricing and break-even calculator package."""
 
 from .models import CostItem, CostType, RevenueInputs, VendorCost
-from .calculator import BreakEvenCalculator, CostSummary
+from .calculator import BreakEvenCalculator, BreakEvenReport, CostSummary
 from .pdf_parser import parse_costs_from_pdf
 from .excel import ExportOptions, export_to_workbook
 
 __all__ = [
     "BreakEvenCalculator",
+    "BreakEvenReport",
     "CostItem",
     "CostSummary",
     "CostType",
@@ -1,14 +1,52 @@
 """Core pricing and break-even calculations."""
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import Dict, Iterable, List, Optional
+from types import MappingProxyType
+from typing import Callable, Dict, Iterable, Mapping, Optional, Tuple, TypeVar
 
-from .models import CostItem, CostType, RevenueInputs
+from .models import CostItem, CostType, RevenueInputs, _SCALE, _from_fixed, _to_fixed, _type_mask
 
+_T = TypeVar("_T")
 
-@dataclass
+_FIXED_MASK = _type_mask(CostType.ONE_TIME, CostType.ANNUAL, CostType.SUBSCRIPTION, CostType.OPERATIONAL)
+_PER_CUSTOMER_MASK = _type_mask(CostType.PER_CUSTOMER)
+_PER_TRANSACTION_MASK = _type_mask(CostType.PER_TRANSACTION)
+
+
+def format_decimal(value: Optional[Decimal]) -> str:
+    """Render a metric with thousands separators and two decimal places."""
+
+    if value is None:
+        return "—"
+    return format(value, ",.2f")
+
+
+def format_currency(value: Optional[Decimal]) -> str:
+    if value is None:
+        return "—"
+    return "$" + format_decimal(value)
+
+
+def _memoized(method: Callable[["BreakEvenCalculator"], _T]) -> Callable[["BreakEvenCalculator"], _T]:
+    """Cache a derived metric on the calculator; its inputs are frozen at construction."""
+
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self: "BreakEvenCalculator") -> _T:
+        try:
+            return self._cache[name]  # type: ignore[return-value]
+        except KeyError:
+            value = self._cache[name] = method(self)
+            return value
+
+    return wrapper
+
+
+@dataclass(frozen=True)
 class CostSummary:
     """Aggregated totals used in reports and exports."""
 
@@ -17,105 +55,181 @@ class CostSummary:
     variable_cost_per_transaction: Decimal
     total_costs: Decimal
 
+    # Display strings are formatted on first use and kept with the (memoized) summary.
+
+    @functools.cached_property
+    def fixed_costs_str(self) -> str:
+        return format_currency(self.fixed_costs)
+
+    @functools.cached_property
+    def variable_cost_per_customer_str(self) -> str:
+        return format_currency(self.variable_cost_per_customer)
+
+    @functools.cached_property
+    def variable_cost_per_transaction_str(self) -> str:
+        return format_currency(self.variable_cost_per_transaction)
+
+    @functools.cached_property
+    def total_costs_str(self) -> str:
+        return format_currency(self.total_costs)
+
+
+@dataclass(frozen=True)
+class BreakEvenReport:
+    """Every metric derived by ``BreakEvenCalculator.compute_all``.
+
+    Reports are memoized and shared, so they are frozen and ``profitability`` is a read-only view.
+    """
+
+    summary: CostSummary
+    break_even_customers: Optional[Decimal]
+    break_even_transactions: Optional[Decimal]
+    required_customer_price: Optional[Decimal]
+    required_transaction_price: Optional[Decimal]
+    profitability: Mapping[str, Decimal]
+
+    @functools.cached_property
+    def break_even_customers_str(self) -> str:
+        return format_decimal(self.break_even_customers)
+
+    @functools.cached_property
+    def break_even_transactions_str(self) -> str:
+        return format_decimal(self.break_even_transactions)
+
+    @functools.cached_property
+    def required_customer_price_str(self) -> str:
+        return format_currency(self.required_customer_price)
+
+    @functools.cached_property
+    def required_transaction_price_str(self) -> str:
+        return format_currency(self.required_transaction_price)
+
+    @functools.cached_property
+    def profitability_str(self) -> Mapping[str, str]:
+        return MappingProxyType({key: format_currency(value) for key, value in self.profitability.items()})
+
 
 class BreakEvenCalculator:
-    """Compute break-even metrics from vendor and internal costs."""
+    """Compute break-even metrics from vendor and internal costs.
+
+    ``cost_items`` is snapshotted into a tuple and ``revenue_inputs`` is frozen, so cost totals are
+    accumulated once at construction using fixed-point integers and derived metrics are memoized
+    without any invalidation. Build a new calculator to change the inputs. The memoized report is
+    frozen; ``profitability_projection`` hands out a fresh dict per call.
+    """
 
     def __init__(
         self,
         cost_items: Iterable[CostItem],
         revenue_inputs: Optional[RevenueInputs] = None,
     ) -> None:
-        self.cost_items: List[CostItem] = list(cost_items)
+        self.cost_items: Tuple[CostItem, ...] = tuple(cost_items)
         self.revenue_inputs = revenue_inputs or RevenueInputs()
+        self._cache: Dict[str, object] = {}
+
+        self._fixed_fp, self._var_cust_fp, self._var_txn_fp = self._group_totals()
+
+    def _group_totals(self) -> Tuple[int, int, int]:
+        """Return the fixed, per-customer, and per-transaction totals from one pass over the costs."""
 
-    def _sum_costs(self, *types: CostType) -> Decimal:
-        total = Decimal("0")
+        fixed = per_customer = per_transaction = 0
         for item in self.cost_items:
-            if item.cost_type in types:
-                amount = item.average_amount
-                if amount is not None:
-                    total += amount
-        return total
+            amount_fp = item._amount_fp
+            if amount_fp is None:
+                continue
+            type_bit = item._type_bit
+            if type_bit & _FIXED_MASK:
+                fixed += amount_fp
+            elif type_bit & _PER_CUSTOMER_MASK:
+                per_customer += amount_fp
+            elif type_bit & _PER_TRANSACTION_MASK:
+                per_transaction += amount_fp
+        return fixed, per_customer, per_transaction
 
     def total_fixed_costs(self) -> Decimal:
-        return self._sum_costs(
-            CostType.ONE_TIME,
-            CostType.ANNUAL,
-            CostType.SUBSCRIPTION,
-            CostType.OPERATIONAL,
-        )
+        return _from_fixed(self._fixed_fp)
 
     def variable_cost_per_customer(self) -> Decimal:
-        return self._sum_costs(CostType.PER_CUSTOMER)
+        return _from_fixed(self._var_cust_fp)
 
     def variable_cost_per_transaction(self) -> Decimal:
-        return self._sum_costs(CostType.PER_TRANSACTION)
+        return _from_fixed(self._var_txn_fp)
 
     def total_costs(self) -> Decimal:
-        return self.total_fixed_costs() + self.variable_cost_per_customer() + self.variable_cost_per_transaction()
+        return _from_fixed(self._fixed_fp + self._var_cust_fp + self._var_txn_fp)
+
+    @_memoized
+    def compute_all(self) -> BreakEvenReport:
+        """Derive every reported metric from the three cost totals in one go."""
+
+        inputs = self.revenue_inputs
+        return BreakEvenReport(
+            summary=CostSummary(
+                fixed_costs=self.total_fixed_costs(),
+                variable_cost_per_customer=self.variable_cost_per_customer(),
+                variable_cost_per_transaction=self.variable_cost_per_transaction(),
+                total_costs=self.total_costs(),
+            ),
+            break_even_customers=self._break_even(inputs.customer_price, self._var_cust_fp),
+            break_even_transactions=self._break_even(inputs.transaction_price, self._var_txn_fp),
+            required_customer_price=self._required_price(inputs.expected_customers, self._var_cust_fp),
+            required_transaction_price=self._required_price(inputs.expected_transactions, self._var_txn_fp),
+            profitability=self._profitability(),
+        )
 
     def summary(self) -> CostSummary:
-        return CostSummary(
-            fixed_costs=self.total_fixed_costs(),
-            variable_cost_per_customer=self.variable_cost_per_customer(),
-            variable_cost_per_transaction=self.variable_cost_per_transaction(),
-            total_costs=self.total_costs(),
-        )
+        return self.compute_all().summary
 
     # --- Break-even computations -------------------------------------------------
 
-    def break_even_customers(self) -> Optional[Decimal]:
-        """Return how many customers are needed to cover fixed costs."""
-
-        revenue_per_customer = self.revenue_inputs.customer_price
-        variable = self.variable_cost_per_customer()
-        contribution_margin = revenue_per_customer - variable
-        if contribution_margin <= 0:
-            return None
-        return self.total_fixed_costs() / contribution_margin
-
-    def break_even_transactions(self) -> Optional[Decimal]:
-        revenue_per_transaction = self.revenue_inputs.transaction_price
-        variable = self.variable_cost_per_transaction()
-        contribution_margin = revenue_per_transaction - variable
+    def _break_even(self, price: Decimal, variable_fp: int) -> Optional[Decimal]:
+        contribution_margin = _to_fixed(price) - variable_fp
         if contribution_margin <= 0:
             return None
-        return self.total_fixed_costs() / contribution_margin
+        return Decimal(self._fixed_fp) / Decimal(contribution_margin)
 
-    def required_customer_price(self) -> Optional[Decimal]:
-        expected_customers = self.revenue_inputs.expected_customers
-        if expected_customers <= 0:
-            return None
-        variable = self.variable_cost_per_customer()
-        fixed = self.total_fixed_costs()
-        return variable + (fixed / Decimal(expected_customers))
-
-    def required_transaction_price(self) -> Optional[Decimal]:
-        expected_transactions = self.revenue_inputs.expected_transactions
-        if expected_transactions <= 0:
+    def _required_price(self, expected_volume: int, variable_fp: int) -> Optional[Decimal]:
+        if expected_volume <= 0:
             return None
-        variable = self.variable_cost_per_transaction()
-        fixed = self.total_fixed_costs()
-        return variable + (fixed / Decimal(expected_transactions))
+        total = variable_fp * expected_volume + self._fixed_fp
+        return Decimal(total) / Decimal(_SCALE * expected_volume)
 
-    def profitability_projection(self) -> Dict[str, Decimal]:
+    def _profitability(self) -> Mapping[str, Decimal]:
+        inputs = self.revenue_inputs
         revenue = (
-            self.revenue_inputs.subscription_revenue
-            + self.revenue_inputs.customer_price * Decimal(self.revenue_inputs.expected_customers)
-            + self.revenue_inputs.transaction_price * Decimal(self.revenue_inputs.expected_transactions)
+            _to_fixed(inputs.subscription_revenue)
+            + _to_fixed(inputs.customer_price) * inputs.expected_customers
+            + _to_fixed(inputs.transaction_price) * inputs.expected_transactions
         )
 
         variable_costs = (
-            self.variable_cost_per_customer() * Decimal(self.revenue_inputs.expected_customers)
-            + self.variable_cost_per_transaction() * Decimal(self.revenue_inputs.expected_transactions)
+            self._var_cust_fp * inputs.expected_customers
+            + self._var_txn_fp * inputs.expected_transactions
+        )
+
+        profit = revenue - variable_costs - self._fixed_fp
+        return MappingProxyType(
+            {
+                "revenue": _from_fixed(revenue),
+                "variable_costs": _from_fixed(variable_costs),
+                "fixed_costs": _from_fixed(self._fixed_fp),
+                "profit": _from_fixed(profit),
+            }
         )
 
-        fixed_costs = self.total_fixed_costs()
-        profit = revenue - variable_costs - fixed_costs
-        return {
-            "revenue": revenue,
-            "variable_costs": variable_costs,
-            "fixed_costs": fixed_costs,
-            "profit": profit,
-        }
+    def break_even_customers(self) -> Optional[Decimal]:
+        """Return how many customers are needed to cover fixed costs."""
+
+        return self.compute_all().break_even_customers
+
+    def break_even_transactions(self) -> Optional[Decimal]:
+        return self.compute_all().break_even_transactions
+
+    def required_customer_price(self) -> Optional[Decimal]:
+        return self.compute_all().required_customer_price
+
+    def required_transaction_price(self) -> Optional[Decimal]:
+        return self.compute_all().required_transaction_price
+
+    def profitability_projection(self) -> Dict[str, Decimal]:
+        return dict(self.compute_all().profitability)
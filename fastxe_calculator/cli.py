@@ -34,15 +34,26 @@ def _parse_manual_costs(entries: Iterable[str]) -> List[VendorCost]:
     return costs
 
 
+def _json_decimal(value: object) -> Optional[Decimal]:
+    """Convert a JSON scalar to Decimal without round-tripping strings and ints through str()."""
+
+    if value is None:
+        return None
+    if isinstance(value, (str, int)):
+        return Decimal(value)
+    # repr() is the shortest string that round-trips a float, e.g. 0.12 rather than its binary expansion.
+    return Decimal(repr(value))
+
+
 def _load_costs_from_json(path: Path) -> List[VendorCost]:
     data = json.loads(path.read_text())
     costs: List[VendorCost] = []
     for entry in data:
         vendor = entry.get("vendor", "custom")
         cost_type = CostType.from_string(entry["type"])
-        amount = Decimal(str(entry.get("amount", "0"))) if "amount" in entry else None
-        min_amount = Decimal(str(entry.get("min_amount"))) if "min_amount" in entry else None
-        max_amount = Decimal(str(entry.get("max_amount"))) if "max_amount" in entry else None
+        amount = _json_decimal(entry.get("amount"))
+        min_amount = _json_decimal(entry.get("min_amount"))
+        max_amount = _json_decimal(entry.get("max_amount"))
         costs.append(
             VendorCost(
                 vendor=vendor,
@@ -64,6 +75,11 @@ def _load_costs_from_json(path: Path) -> List[VendorCost]:
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="FastXE pricing and break-even calculator")
     parser.add_argument("--pdf", nargs="*", help="Vendor PDF files to parse for pricing data")
+    parser.add_argument(
+        "--pdf-classified-only",
+        action="store_true",
+        help="Ignore PDF lines without a recognised cost keyword instead of recording them as 'other' costs.",
+    )
     parser.add_argument(
         "--cost",
         action="append",
@@ -109,7 +125,7 @@ def build_parser() -> argparse.ArgumentParser:
 def gather_costs_from_inputs(args: argparse.Namespace) -> List[VendorCost]:
     costs: List[VendorCost] = []
     if args.pdf:
-        costs.extend(parse_multiple_pdfs(args.pdf))
+        costs.extend(parse_multiple_pdfs(args.pdf, include_unclassified=not args.pdf_classified_only))
     if args.cost:
         costs.extend(_parse_manual_costs(args.cost))
     if args.cost_json:
@@ -126,21 +142,23 @@ def main(argv: Iterable[str] | None = None) -> Optional[Path]:
         analysis_period_months=args.analysis_period_months,
         expected_customers=args.expected_customers,
         expected_transactions=args.expected_transactions,
-        customer_price=Decimal(str(args.customer_price)),
-        transaction_price=Decimal(str(args.transaction_price)),
-        subscription_revenue=Decimal(str(args.subscription_revenue)),
+        # argparse already converts these options with type=Decimal.
+        customer_price=args.customer_price,
+        transaction_price=args.transaction_price,
+        subscription_revenue=args.subscription_revenue,
     )
 
     calculator = BreakEvenCalculator([cost.item for cost in costs], revenue_inputs)
-    summary = calculator.summary()
+    report = calculator.compute_all()
+    summary = report.summary
 
     print("--- Cost Summary ---")
     print(f"Fixed costs: {summary.fixed_costs:,.2f}")
     print(f"Variable cost per customer: {summary.variable_cost_per_customer:,.2f}")
     print(f"Variable cost per transaction: {summary.variable_cost_per_transaction:,.2f}")
 
-    breakeven_customers = calculator.break_even_customers()
-    breakeven_transactions = calculator.break_even_transactions()
+    breakeven_customers = report.break_even_customers
+    breakeven_transactions = report.break_even_transactions
     if breakeven_customers is not None:
         print(f"Break-even customers at configured price: {breakeven_customers:,.2f}")
     else:
@@ -150,14 +168,14 @@ def main(argv: Iterable[str] | None = None) -> Optional[Path]:
     else:
         print("Break-even transactions could not be determined (insufficient margin).")
 
-    required_customer_price = calculator.required_customer_price()
-    required_transaction_price = calculator.required_transaction_price()
+    required_customer_price = report.required_customer_price
+    required_transaction_price = report.required_transaction_price
     if required_customer_price is not None:
         print(f"Required price per customer: {required_customer_price:,.2f}")
     if required_transaction_price is not None:
         print(f"Required price per transaction: {required_transaction_price:,.2f}")
 
-    profitability = calculator.profitability_projection()
+    profitability = report.profitability
     print("Projected revenue: {0:,.2f}".format(profitability["revenue"]))
     print("Projected variable costs: {0:,.2f}".format(profitability["variable_costs"]))
     print("Projected fixed costs: {0:,.2f}".format(profitability["fixed_costs"]))
@@ -174,6 +192,7 @@ def main(argv: Iterable[str] | None = None) -> Optional[Path]:
                 output_path=args.output,
                 revenue_inputs=revenue_inputs,
                 expected_period_label=args.period_label,
+                calculator=calculator,
             ),
         )
     except RuntimeError as exc:
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterable, List, Optional, Sequence
 
 try:
     from openpyxl import Workbook
@@ -23,20 +23,37 @@ class ExportOptions:
     output_path: Path
     revenue_inputs: RevenueInputs
     expected_period_label: str = "12-month outlook"
+    # Reuse an already-populated calculator built from the same costs instead of computing them again.
+    # It must have been built with ``revenue_inputs``.
+    calculator: Optional[BreakEvenCalculator] = None
 
 
 def _ensure_workbook() -> Workbook:
     if Workbook is None:
         raise RuntimeError("openpyxl is required to export Excel workbooks. Please install the optional dependency.")
-    return Workbook()
+    # Write-only workbooks stream rows to disk instead of keeping a cell object per value.
+    return Workbook(write_only=True)
 
 
-def _auto_size_columns(worksheet) -> None:
-    if get_column_letter is None:
-        return
-    for column_cells in worksheet.columns:
-        length = max(len(str(cell.value)) if cell.value is not None else 0 for cell in column_cells)
-        worksheet.column_dimensions[get_column_letter(column_cells[0].column)].width = max(12, length + 2)
+def _append_rows(worksheet, rows: Sequence[Sequence[object]]) -> None:
+    """Size every column to its widest value, then stream the rows into the sheet.
+
+    Write-only worksheets only honour column widths set before the first row is written.
+    """
+
+    widths: List[int] = []
+    for row in rows:
+        for index, value in enumerate(row):
+            length = len(str(value)) if value is not None else 0
+            if index < len(widths):
+                if length > widths[index]:
+                    widths[index] = length
+            else:
+                widths.append(length)
+    for index, width in enumerate(widths, start=1):
+        worksheet.column_dimensions[get_column_letter(index)].width = max(12, width + 2)
+    for row in rows:
+        worksheet.append(row)
 
 
 def _costs_by_type(costs: Iterable[VendorCost], *cost_types: CostType) -> List[VendorCost]:
@@ -50,9 +67,9 @@ def _costs_by_type(costs: Iterable[VendorCost], *cost_types: CostType) -> List[V
 def _write_cost_sheet(workbook, sheet_name: str, costs: Iterable[VendorCost]) -> None:
     worksheet = workbook.create_sheet(title=sheet_name)
     headers = ["Vendor", "Item", "Type", "Amount", "Min", "Max", "Unit", "Notes", "Source"]
-    worksheet.append(headers)
+    rows: List[Sequence[object]] = [headers]
     for cost in costs:
-        worksheet.append(
+        rows.append(
             [
                 cost.vendor,
                 cost.item.name,
@@ -65,14 +82,19 @@ def _write_cost_sheet(workbook, sheet_name: str, costs: Iterable[VendorCost]) ->
                 cost.item.source,
             ]
         )
-    _auto_size_columns(worksheet)
+    _append_rows(worksheet, rows)
 
 
 def export_to_workbook(costs: Iterable[VendorCost], options: ExportOptions) -> Path:
     """Create an Excel workbook containing cost breakdowns and break-even metrics."""
 
+    revenue_inputs = options.revenue_inputs
+    calculator = options.calculator
+    # The Summary and Revenue Inputs sheets must describe the same assumptions.
+    if calculator is not None and calculator.revenue_inputs != revenue_inputs:
+        raise ValueError("ExportOptions.calculator was built with different revenue inputs")
+
     workbook = _ensure_workbook()
-    workbook.remove(workbook.active)
 
     cost_list = list(costs)
 
@@ -89,99 +111,105 @@ def export_to_workbook(costs: Iterable[VendorCost], options: ExportOptions) -> P
     _write_cost_sheet(workbook, "Variable Costs", variable_costs)
     _write_cost_sheet(workbook, "All Costs", cost_list)
 
-    calculator = BreakEvenCalculator([cost.item for cost in cost_list], options.revenue_inputs)
-    summary = calculator.summary()
-    profitability = calculator.profitability_projection()
+    if calculator is None:
+        calculator = BreakEvenCalculator([cost.item for cost in cost_list], revenue_inputs)
+    report = calculator.compute_all()
+    summary = report.summary
+    profitability = report.profitability
 
     summary_sheet = workbook.create_sheet(title="Summary")
-    break_even_customers = calculator.break_even_customers()
-    break_even_transactions = calculator.break_even_transactions()
-    required_customer_price = calculator.required_customer_price()
-    required_transaction_price = calculator.required_transaction_price()
-    summary_sheet.append(["Metric", "Value", "Notes"])
-    summary_sheet.append(["Analysis Period", options.expected_period_label, None])
-    summary_sheet.append(["Fixed costs", float(summary.fixed_costs), "One-time + annual + recurring operational costs"])
-    summary_sheet.append(
+    break_even_customers = report.break_even_customers
+    break_even_transactions = report.break_even_transactions
+    required_customer_price = report.required_customer_price
+    required_transaction_price = report.required_transaction_price
+    _append_rows(
+        summary_sheet,
         [
-            "Variable cost per customer",
-            float(summary.variable_cost_per_customer),
-            "Costs that scale with the number of active customers",
-        ]
-    )
-    summary_sheet.append(
-        [
-            "Variable cost per transaction",
-            float(summary.variable_cost_per_transaction),
-            "Costs that scale with transaction count",
-        ]
+            ["Metric", "Value", "Notes"],
+            ["Analysis Period", options.expected_period_label, None],
+            ["Fixed costs", float(summary.fixed_costs), "One-time + annual + recurring operational costs"],
+            [
+                "Variable cost per customer",
+                float(summary.variable_cost_per_customer),
+                "Costs that scale with the number of active customers",
+            ],
+            [
+                "Variable cost per transaction",
+                float(summary.variable_cost_per_transaction),
+                "Costs that scale with transaction count",
+            ],
+            [
+                "Break-even customers",
+                float(break_even_customers) if break_even_customers is not None else None,
+                "Number of customers needed at the configured price",
+            ],
+            [
+                "Break-even transactions",
+                float(break_even_transactions) if break_even_transactions is not None else None,
+                "Number of transactions needed at the configured price",
+            ],
+            [
+                "Required price per customer",
+                float(required_customer_price) if required_customer_price is not None else None,
+                "Price per customer to break even at the expected volume",
+            ],
+            [
+                "Required price per transaction",
+                float(required_transaction_price) if required_transaction_price is not None else None,
+                "Price per transaction to break even at the expected volume",
+            ],
+            [
+                "Projected revenue",
+                float(profitability["revenue"]),
+                "Revenue based on expected volumes and prices",
+            ],
+            [
+                "Projected variable costs",
+                float(profitability["variable_costs"]),
+                "Variable costs at expected volumes",
+            ],
+            [
+                "Projected fixed costs",
+                float(profitability["fixed_costs"]),
+                "Fixed costs within the analysis period",
+            ],
+            [
+                "Projected profit",
+                float(profitability["profit"]),
+                "Revenue minus total costs",
+            ],
+        ],
     )
-    summary_sheet.append([
-        "Break-even customers",
-        float(break_even_customers) if break_even_customers is not None else None,
-        "Number of customers needed at the configured price",
-    ])
-    summary_sheet.append([
-        "Break-even transactions",
-        float(break_even_transactions) if break_even_transactions is not None else None,
-        "Number of transactions needed at the configured price",
-    ])
-    summary_sheet.append([
-        "Required price per customer",
-        float(required_customer_price) if required_customer_price is not None else None,
-        "Price per customer to break even at the expected volume",
-    ])
-    summary_sheet.append([
-        "Required price per transaction",
-        float(required_transaction_price) if required_transaction_price is not None else None,
-        "Price per transaction to break even at the expected volume",
-    ])
-    summary_sheet.append([
-        "Projected revenue",
-        float(profitability["revenue"]),
-        "Revenue based on expected volumes and prices",
-    ])
-    summary_sheet.append([
-        "Projected variable costs",
-        float(profitability["variable_costs"]),
-        "Variable costs at expected volumes",
-    ])
-    summary_sheet.append([
-        "Projected fixed costs",
-        float(profitability["fixed_costs"]),
-        "Fixed costs within the analysis period",
-    ])
-    summary_sheet.append([
-        "Projected profit",
-        float(profitability["profit"]),
-        "Revenue minus total costs",
-    ])
-    _auto_size_columns(summary_sheet)
 
     revenue_sheet = workbook.create_sheet(title="Revenue Inputs")
-    revenue_sheet.append(["Assumption", "Value", "Notes"])
-    revenue_sheet.append(["Expected customers", options.revenue_inputs.expected_customers, None])
-    revenue_sheet.append(["Expected transactions", options.revenue_inputs.expected_transactions, None])
-    revenue_sheet.append([
-        "Customer price",
-        float(options.revenue_inputs.customer_price),
-        "Fee charged to each customer in the analysis period",
-    ])
-    revenue_sheet.append([
-        "Transaction price",
-        float(options.revenue_inputs.transaction_price),
-        "Fee charged per transaction",
-    ])
-    revenue_sheet.append([
-        "Subscription revenue",
-        float(options.revenue_inputs.subscription_revenue),
-        "Flat recurring revenue (if applicable)",
-    ])
-    revenue_sheet.append([
-        "Analysis period (months)",
-        options.revenue_inputs.analysis_period_months,
-        "All costs should be expressed within this window",
-    ])
-    _auto_size_columns(revenue_sheet)
+    _append_rows(
+        revenue_sheet,
+        [
+            ["Assumption", "Value", "Notes"],
+            ["Expected customers", revenue_inputs.expected_customers, None],
+            ["Expected transactions", revenue_inputs.expected_transactions, None],
+            [
+                "Customer price",
+                float(revenue_inputs.customer_price),
+                "Fee charged to each customer in the analysis period",
+            ],
+            [
+                "Transaction price",
+                float(revenue_inputs.transaction_price),
+                "Fee charged per transaction",
+            ],
+            [
+                "Subscription revenue",
+                float(revenue_inputs.subscription_revenue),
+                "Flat recurring revenue (if applicable)",
+            ],
+            [
+                "Analysis period (months)",
+                revenue_inputs.analysis_period_months,
+                "All costs should be expressed within this window",
+            ],
+        ],
+    )
 
     output_path = options.output_path
     workbook.save(output_path)
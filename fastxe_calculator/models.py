@@ -1,11 +1,36 @@
 """Data models used across the FastXE calculator."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+import functools
+from dataclasses import dataclass, fields, replace
 from decimal import Decimal
 from enum import Enum
 from typing import List, Optional
 
+# Cost totals are accumulated as integers scaled by ``_SCALE`` so the hot sums avoid Decimal arithmetic.
+_SCALE = 10**8
+
+
+# Amounts of 10**_MAX_EXPONENT or more are rejected: no real price is that large, and scaling values
+# near the Decimal context's exponent limit by ``_SCALE`` would overflow.
+_MAX_EXPONENT = 100
+
+
+def _fits_fixed(value: Decimal) -> bool:
+    """Return whether ``_to_fixed`` can represent ``value``."""
+
+    return value.is_finite() and value.adjusted() < _MAX_EXPONENT
+
+
+def _to_fixed(value: Decimal) -> int:
+    if not _fits_fixed(value):
+        raise ValueError(f"Amounts must be finite numbers below 1e{_MAX_EXPONENT}, got {value}")
+    return int((value * _SCALE).to_integral_value())
+
+
+def _from_fixed(value: int) -> Decimal:
+    return Decimal(value) / _SCALE
+
 
 class CostType(str, Enum):
     """Enumeration of the supported cost categories."""
@@ -20,14 +45,33 @@ class CostType(str, Enum):
 
     @classmethod
     def from_string(cls, value: str) -> "CostType":
-        normalized = value.strip().lower().replace("-", "_")
-        for member in cls:
-            if member.value == normalized:
-                return member
-        raise ValueError(f"Unknown cost type: {value}")
+        return _cost_type_from_string(value)
+
+
+_COST_TYPE_BY_VALUE = {member.value: member for member in CostType}
+
+
+@functools.lru_cache(maxsize=64)
+def _cost_type_from_string(value: str) -> CostType:
+    normalized = value.strip().lower().replace("-", "_")
+    try:
+        return _COST_TYPE_BY_VALUE[normalized]
+    except KeyError:
+        raise ValueError(f"Unknown cost type: {value}") from None
 
 
-@dataclass
+# One bit per cost type so category filters reduce to a single integer AND per item.
+_TYPE_BITS = {cost_type: 1 << index for index, cost_type in enumerate(CostType)}
+
+
+def _type_mask(*cost_types: CostType) -> int:
+    mask = 0
+    for cost_type in cost_types:
+        mask |= _TYPE_BITS[cost_type]
+    return mask
+
+
+@dataclass(slots=True, frozen=True)
 class VendorCost:
     """Describes a cost line for a specific vendor."""
 
@@ -35,9 +79,20 @@ class VendorCost:
     item: "CostItem"
 
 
-@dataclass
-class CostItem:
-    """Represents a single cost, optionally with a range."""
+class _DerivedCostSlots:
+    """Slots for values ``CostItem`` derives from its fields; they are not dataclass fields."""
+
+    __slots__ = ("_average", "_amount_fp", "_type_bit")
+
+
+@dataclass(slots=True, frozen=True)
+class CostItem(_DerivedCostSlots):
+    """Represents a single cost, optionally with a range.
+
+    Instances are immutable. The average and its fixed-point form are derived once in
+    ``__post_init__`` and live outside the dataclass fields, so ``asdict``, ``repr``, and
+    equality only see the inputs.
+    """
 
     name: str
     cost_type: CostType
@@ -50,26 +105,43 @@ class CostItem:
 
     def __post_init__(self) -> None:
         if self.amount is not None and isinstance(self.amount, (int, float)):
-            self.amount = Decimal(str(self.amount))
+            object.__setattr__(self, "amount", Decimal(str(self.amount)))
         if self.min_amount is not None and isinstance(self.min_amount, (int, float)):
-            self.min_amount = Decimal(str(self.min_amount))
+            object.__setattr__(self, "min_amount", Decimal(str(self.min_amount)))
         if self.max_amount is not None and isinstance(self.max_amount, (int, float)):
-            self.max_amount = Decimal(str(self.max_amount))
+            object.__setattr__(self, "max_amount", Decimal(str(self.max_amount)))
+        if self.amount is not None:
+            average = self.amount
+        elif self.min_amount is not None and self.max_amount is not None:
+            average = (self.min_amount + self.max_amount) / Decimal("2")
+        else:
+            average = self.min_amount or self.max_amount
+        object.__setattr__(self, "_average", average)
+        object.__setattr__(self, "_amount_fp", _to_fixed(average) if average is not None else None)
+        object.__setattr__(self, "_type_bit", _TYPE_BITS[self.cost_type])
+
+    def __getstate__(self) -> List[object]:
+        return [getattr(self, item_field.name) for item_field in fields(self)]
+
+    def __setstate__(self, state: List[object]) -> None:
+        # Only the fields are pickled; the derived slots are rebuilt from them.
+        for item_field, value in zip(fields(self), state):
+            object.__setattr__(self, item_field.name, value)
+        self.__post_init__()
 
     @property
     def average_amount(self) -> Optional[Decimal]:
         """Return the average value across min/max or the single amount."""
 
-        if self.amount is not None:
-            return self.amount
-        if self.min_amount is not None and self.max_amount is not None:
-            return (self.min_amount + self.max_amount) / Decimal("2")
-        return self.min_amount or self.max_amount
+        return self._average
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RevenueInputs:
-    """Holds the revenue related assumptions for the break-even analysis."""
+    """Holds the revenue related assumptions for the break-even analysis.
+
+    Instances are immutable (and hashable); use ``clone_with`` to derive a modified copy.
+    """
 
     analysis_period_months: int = 12
     expected_customers: int = 0
@@ -80,22 +152,11 @@ class RevenueInputs:
 
     def __post_init__(self) -> None:
         if not isinstance(self.customer_price, Decimal):
-            self.customer_price = Decimal(str(self.customer_price))
+            object.__setattr__(self, "customer_price", Decimal(str(self.customer_price)))
         if not isinstance(self.transaction_price, Decimal):
-            self.transaction_price = Decimal(str(self.transaction_price))
+            object.__setattr__(self, "transaction_price", Decimal(str(self.transaction_price)))
         if not isinstance(self.subscription_revenue, Decimal):
-            self.subscription_revenue = Decimal(str(self.subscription_revenue))
+            object.__setattr__(self, "subscription_revenue", Decimal(str(self.subscription_revenue)))
 
     def clone_with(self, **updates: object) -> "RevenueInputs":
-        data = {
-            "analysis_period_months": self.analysis_period_months,
-            "expected_customers": self.expected_customers,
-            "expected_transactions": self.expected_transactions,
-            "customer_price": self.customer_price,
-            "transaction_price": self.transaction_price,
-            "subscription_revenue": self.subscription_revenue,
-        }
-        data.update(updates)
-        return RevenueInputs(**data)  # type: ignore[arg-type]
-
-
+        return replace(self, **updates)  # type: ignore[arg-type]
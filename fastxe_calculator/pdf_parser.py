@@ -1,17 +1,28 @@
 """Utility helpers to extract pricing details from vendor PDF documents."""
 from __future__ import annotations
 
+import dataclasses
+import hashlib
+import io
+import json
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from decimal import Decimal
 from pathlib import Path
-from typing import Iterable, List, Optional, Sequence
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 try:
     from pypdf import PdfReader
 except Exception:  # pragma: no cover - optional dependency at runtime
     PdfReader = None  # type: ignore[assignment]
 
+try:
+    import ahocorasick
+except Exception:  # pragma: no cover - optional dependency at runtime
+    ahocorasick = None  # type: ignore[assignment]
+
 from .models import CostItem, CostType, VendorCost
 
 _COST_KEYWORDS = {
@@ -23,6 +34,34 @@ _COST_KEYWORDS = {
     CostType.OPERATIONAL: ["operational", "ops", "support", "maintenance"],
 }
 
+_KEYWORD_TYPES = list(_COST_KEYWORDS)
+
+
+def _build_keyword_automaton():
+    """Build an Aho-Corasick automaton mapping every keyword to its cost type priority."""
+
+    automaton = ahocorasick.Automaton()
+    for priority, keywords in enumerate(_COST_KEYWORDS.values()):
+        for keyword in keywords:
+            automaton.add_word(keyword, priority)
+    automaton.make_automaton()
+    return automaton
+
+
+# Used when ``pyahocorasick`` is installed: one pass finds every keyword, including overlapping
+# ones. Without it, each cost type's keywords are checked with plain substring tests.
+_KEYWORD_AUTOMATON = _build_keyword_automaton() if ahocorasick is not None else None
+
+# Bump whenever parsing logic changes so cached results from older versions are ignored.
+_PARSER_VERSION = "2"
+
+# The cache stores JSON objects of the item fields (decimals as strings) rather than serialised
+# models, and the field names are part of the cache key, so changing ``CostItem`` invalidates old
+# entries instead of loading stale ones.
+_CACHED_ITEM_FIELDS = tuple(item_field.name for item_field in dataclasses.fields(CostItem) if item_field.init)
+_CACHED_DECIMAL_FIELDS = frozenset({"amount", "min_amount", "max_amount"})
+_CACHE_SCHEMA = ",".join(_CACHED_ITEM_FIELDS)
+
 _AMOUNT_PATTERN = re.compile(
     r"(?P<prefix>^|[^\d])\$?(?P<amount>[0-9]{1,3}(?:,[0-9]{3})*(?:\.[0-9]+)?)(?P<suffix>[^\d]|$)"
 )
@@ -49,12 +88,22 @@ class ParsedLine:
         return None
 
 
-def _detect_cost_type(text: str) -> CostType:
-    lowered = text.lower()
-    for cost_type, keywords in _COST_KEYWORDS.items():
-        if any(keyword in lowered for keyword in keywords):
-            return cost_type
-    return CostType.OTHER
+def _detect_cost_type(lowered: str) -> CostType:
+    """Classify an already lower-cased line by its cost keywords."""
+
+    if _KEYWORD_AUTOMATON is None:
+        for cost_type, keywords in _COST_KEYWORDS.items():
+            if any(keyword in lowered for keyword in keywords):
+                return cost_type
+        return CostType.OTHER
+
+    best: Optional[int] = None
+    for _, priority in _KEYWORD_AUTOMATON.iter(lowered):
+        if best is None or priority < best:
+            best = priority
+            if priority == 0:
+                break
+    return _KEYWORD_TYPES[best] if best is not None else CostType.OTHER
 
 
 def _normalize_amount(value: str) -> Decimal:
@@ -75,54 +124,215 @@ def _extract_amounts(text: str) -> ParsedLine:
     return ParsedLine(text=text, amounts=amounts)
 
 
-def parse_costs_from_pdf(path: str | Path, vendor_name: Optional[str] = None) -> List[VendorCost]:
-    """Parse a PDF file and return the detected vendor cost items."""
+def _cache_dir() -> Path:
+    override = os.environ.get("FASTXE_CACHE_DIR")
+    if override:
+        return Path(override)
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "fastxe_calculator"
+
+
+def _cache_path(data: bytes, *key_parts: str) -> Path:
+    digest = hashlib.sha256()
+    # Anything that shapes the parsed items (source path, vendor label, options) is part of the key.
+    for part in (_PARSER_VERSION, _CACHE_SCHEMA, *key_parts):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    digest.update(data)
+    return _cache_dir() / f"{digest.hexdigest()}.json"
+
+
+def _cost_to_record(cost: VendorCost) -> Dict[str, Optional[str]]:
+    """Flatten a cost into JSON-safe strings; the cost type is stored by value."""
+
+    item = cost.item
+    record: Dict[str, Optional[str]] = {"vendor": cost.vendor}
+    for name in _CACHED_ITEM_FIELDS:
+        value = getattr(item, name)
+        record[name] = value if value is None or isinstance(value, str) else str(value)
+    record["cost_type"] = item.cost_type.value
+    return record
+
+
+def _cost_from_record(record: object) -> VendorCost:
+    if not isinstance(record, dict) or record.keys() != {"vendor", *_CACHED_ITEM_FIELDS}:
+        raise ValueError("Unexpected cache record")
+    if not all(value is None or isinstance(value, str) for value in record.values()):
+        raise ValueError("Unexpected cache record")
+    fields = {name: record[name] for name in _CACHED_ITEM_FIELDS}
+    for name in _CACHED_DECIMAL_FIELDS:
+        if fields[name] is not None:
+            fields[name] = Decimal(fields[name])
+    fields["cost_type"] = CostType(fields["cost_type"])
+    return VendorCost(vendor=record["vendor"], item=CostItem(**fields))
+
+
+def _load_cached(cache_path: Path) -> Optional[List[VendorCost]]:
+    try:
+        with cache_path.open("r", encoding="utf-8") as handle:
+            records = json.load(handle)
+        if not isinstance(records, list):
+            return None
+        return [_cost_from_record(record) for record in records]
+    except FileNotFoundError:
+        return None
+    except Exception:  # pragma: no cover - corrupt or stale cache entries are simply re-parsed
+        return None
+
+
+def _store_cached(cache_path: Path, costs: List[VendorCost]) -> None:
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        with temp_path.open("w", encoding="utf-8") as handle:
+            json.dump([_cost_to_record(cost) for cost in costs], handle)
+        os.replace(temp_path, cache_path)
+    except OSError:  # pragma: no cover - caching is best effort
+        pass
 
+
+def _line_name(line: str, fallback: str) -> str:
+    """Use the text before the first colon as the item name (the whole line when there is none)."""
+
+    head, separator, _ = line.partition(":")
+    if not separator:
+        # Lines are stripped and non-empty by the time they reach here.
+        return line
+    return head.strip() or fallback
+
+
+def _page_text(page) -> str:
+    try:
+        return page.extract_text() or ""
+    except Exception:  # pragma: no cover - library dependent
+        return ""
+
+
+def _parse_pdf_bytes(
+    data: bytes,
+    vendor_label: str,
+    source: str,
+    include_unclassified: bool = True,
+) -> List[VendorCost]:
+    reader = PdfReader(io.BytesIO(data))
+    strip = str.strip
+    lines: List[str] = [
+        line for page in reader.pages for raw in _page_text(page).splitlines() if (line := strip(raw))
+    ]
+
+    # Bind the per-line helpers locally; these loops are the hot path for large PDFs. By default
+    # only lines with an amount are classified. When unclassified lines are dropped, keyword
+    # detection runs first instead so lines without a cost keyword skip the amount regex.
+    extract_amounts, detect_cost_type, other = _extract_amounts, _detect_cost_type, CostType.OTHER
+    if include_unclassified:
+        matches = [
+            (line, parsed, detect_cost_type(line.lower()))
+            for line in lines
+            if (parsed := extract_amounts(line)).average_amount is not None
+        ]
+    else:
+        matches = [
+            (line, parsed, cost_type)
+            for line in lines
+            if (cost_type := detect_cost_type(line.lower())) is not other
+            and (parsed := extract_amounts(line)).average_amount is not None
+        ]
+
+    line_name, cost_item, vendor_cost = _line_name, CostItem, VendorCost
+    return [
+        vendor_cost(
+            vendor=vendor_label,
+            item=cost_item(
+                name=line_name(line, vendor_label),
+                cost_type=cost_type,
+                amount=parsed.amounts[0] if parsed.amounts else None,
+                min_amount=parsed.min_amount,
+                max_amount=parsed.max_amount,
+                notes=line,
+                source=source,
+            ),
+        )
+        for line, parsed, cost_type in matches
+    ]
+
+
+@dataclass(frozen=True)
+class _PdfJob:
+    """A PDF read into memory together with everything needed to parse and cache it."""
+
+    data: bytes
+    vendor_label: str
+    source: str
+    include_unclassified: bool
+    cache_path: Path
+
+
+def _prepare_pdf(path: str | Path, vendor_name: Optional[str], include_unclassified: bool) -> _PdfJob:
     pdf_path = Path(path)
     if PdfReader is None:
         raise RuntimeError("pypdf is required to parse PDF files. Please install the optional dependency.")
 
-    reader = PdfReader(str(pdf_path))
-    lines: List[str] = []
-    for page in reader.pages:
-        try:
-            text = page.extract_text() or ""
-        except Exception:  # pragma: no cover - library dependent
-            text = ""
-        lines.extend(filter(None, (line.strip() for line in text.splitlines())))
-
-    items: List[VendorCost] = []
+    data = pdf_path.read_bytes()
     vendor_label = vendor_name or pdf_path.stem
+    source = str(pdf_path)
+    cache_path = _cache_path(data, source, vendor_label, "all" if include_unclassified else "classified")
+    return _PdfJob(data, vendor_label, source, include_unclassified, cache_path)
 
-    for line in lines:
-        parsed = _extract_amounts(line)
-        amount = parsed.average_amount
-        if amount is None:
-            continue
-
-        cost_type = _detect_cost_type(line)
-        name = line.split(":", 1)[0].strip()
-        if not name:
-            name = vendor_label
-
-        item = CostItem(
-            name=name,
-            cost_type=cost_type,
-            amount=amount if parsed.amounts else None,
-            min_amount=parsed.min_amount,
-            max_amount=parsed.max_amount,
-            notes=line,
-            source=str(pdf_path),
-        )
-        items.append(VendorCost(vendor=vendor_label, item=item))
 
-    return items
+def _parse_and_store(job: _PdfJob) -> List[VendorCost]:
+    costs = _parse_pdf_bytes(job.data, job.vendor_label, job.source, job.include_unclassified)
+    _store_cached(job.cache_path, costs)
+    return costs
+
+
+def parse_costs_from_pdf(
+    path: str | Path,
+    vendor_name: Optional[str] = None,
+    include_unclassified: bool = True,
+) -> List[VendorCost]:
+    """Parse a PDF file and return the detected vendor cost items.
+
+    Lines with an amount but no cost keyword are kept as ``CostType.OTHER`` items unless
+    ``include_unclassified`` is false, in which case they are skipped before any amount parsing;
+    this is noticeably faster on documents with a lot of narrative text.
 
+    Results are cached on disk keyed by the SHA-256 of the file contents (plus the parser version,
+    cost item fields, path, and vendor label), so unchanged PDFs are not re-parsed on later runs. Set
+    ``FASTXE_CACHE_DIR`` to relocate the cache.
+    """
 
-def parse_multiple_pdfs(paths: Iterable[str | Path]) -> List[VendorCost]:
-    """Parse several PDF files and concatenate the resulting vendor costs."""
+    job = _prepare_pdf(path, vendor_name, include_unclassified)
+    cached = _load_cached(job.cache_path)
+    if cached is not None:
+        return cached
+    return _parse_and_store(job)
 
-    costs: List[VendorCost] = []
+
+def parse_multiple_pdfs(paths: Iterable[str | Path], include_unclassified: bool = True) -> List[VendorCost]:
+    """Parse several PDF files and concatenate the resulting vendor costs.
+
+    Cached results are loaded in this process. PDF text extraction is CPU-bound, so when more than
+    one file misses the cache the misses are parsed in parallel worker processes. Results keep the
+    order of ``paths``.
+    """
+
+    results: List[Optional[List[VendorCost]]] = []
+    misses: List[Tuple[int, _PdfJob]] = []
     for path in paths:
-        costs.extend(parse_costs_from_pdf(path))
-    return costs
+        job = _prepare_pdf(path, None, include_unclassified)
+        cached = _load_cached(job.cache_path)
+        if cached is None:
+            misses.append((len(results), job))
+        results.append(cached)
+
+    if len(misses) == 1:
+        index, job = misses[0]
+        results[index] = _parse_and_store(job)
+    elif misses:
+        workers = min(len(misses), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            parsed = executor.map(_parse_and_store, [job for _, job in misses])
+            for (index, _), costs in zip(misses, parsed):
+                results[index] = costs
+
+    return [cost for costs in results for cost in costs]
@@ -2,14 +2,119 @@
 from __future__ import annotations
 
 import argparse
+import functools
+import itertools
+from collections.abc import Iterable, Mapping
 from decimal import Decimal, InvalidOperation
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from types import MappingProxyType
+from typing import NamedTuple
 
-from flask import Flask, render_template, request
+from flask import Flask, request
 
-from .calculator import BreakEvenCalculator
-from .models import CostItem, CostType, RevenueInputs
+from .calculator import BreakEvenCalculator, format_currency, format_decimal
+from .models import _COST_TYPE_BY_VALUE, CostItem, CostType, RevenueInputs, _fits_fixed
+
+
+_COST_TYPE_OPTIONS = [
+    {
+        "value": cost_type.value,
+        "label": cost_type.name.replace("_", " ").title(),
+    }
+    for cost_type in CostType
+]
+
+
+def _parse_decimal_text(value: str) -> Decimal | None:
+    """Parse a form string as Decimal; invalid input yields None instead of raising.
+
+    NaN, infinities, and values too large for the calculator's fixed-point integers are rejected too.
+    """
+
+    try:
+        parsed = Decimal(value)
+    except (InvalidOperation, ValueError):
+        return None
+    return parsed if _fits_fixed(parsed) else None
+
+
+def _parse_int_text(value: str) -> int | None:
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+# Repeated form values are memoized, but only short strings are cached so junk submissions cannot
+# pin arbitrarily large values in memory; longer input is parsed directly.
+_CACHEABLE_LENGTH = 32
+_cached_decimal = functools.lru_cache(maxsize=4096)(_parse_decimal_text)
+_cached_int = functools.lru_cache(maxsize=1024)(_parse_int_text)
+
+
+def _decimal_or_none(value: str) -> Decimal | None:
+    if len(value) <= _CACHEABLE_LENGTH:
+        return _cached_decimal(value)
+    return _parse_decimal_text(value)
+
+
+def _int_or_none(value: str) -> int | None:
+    if len(value) <= _CACHEABLE_LENGTH:
+        return _cached_int(value)
+    return _parse_int_text(value)
+
+
+class _CostRow(NamedTuple):
+    """A submitted cost row as redisplayed in the form (raw, unstripped values)."""
+
+    vendor: str
+    cost_type: str
+    name: str
+    amount: str
+    notes: str
+
+
+_DEFAULT_COST_ROW = _CostRow(vendor="", cost_type=CostType.OPERATIONAL.value, name="", amount="", notes="")
+
+
+_FORM_DEFAULTS = {
+    "expected_customers": "2500",
+    "expected_transactions": "120000",
+    "customer_price": "35",
+    "transaction_price": "0.45",
+    "subscription_revenue": "0",
+    "analysis_period_months": "12",
+}
+_FORM_KEYS = tuple(_FORM_DEFAULTS)
+_FORM_DEFAULT_VALUES = tuple(_FORM_DEFAULTS.values())
+
+
+def _dashboard_results(
+    cost_entries: tuple[tuple[CostType, Decimal], ...],
+    revenue_inputs: RevenueInputs,
+) -> Mapping[str, object]:
+    """Compute the results section for a submission.
+
+    The result may be shared between requests (see ``_cached_dashboard_results``), so it is returned
+    as a read-only mapping.
+    """
+
+    cost_items = [CostItem(name="", cost_type=cost_type, amount=amount) for cost_type, amount in cost_entries]
+    report = BreakEvenCalculator(cost_items, revenue_inputs).compute_all()
+    return MappingProxyType(
+        {
+            "report": report,
+            "revenue_inputs": revenue_inputs,
+            "cost_count": len(cost_items),
+        }
+    )
+
+
+# Identical re-submissions are served from this cache. Like the number caches, it only takes
+# submissions whose numbers are short strings and whose row count is modest, so a single client
+# cannot fill it with huge keys.
+_CACHEABLE_ROWS = 256
+_cached_dashboard_results = functools.lru_cache(maxsize=512)(_dashboard_results)
 
 
 def _resource_path(*parts: str) -> str:
@@ -22,191 +127,237 @@ def create_app() -> Flask:
         template_folder=_resource_path("templates"),
         static_folder=_resource_path("static"),
     )
-
-    cost_type_options = [
-        {
-            "value": cost_type.value,
-            "label": cost_type.name.replace("_", " ").title(),
-        }
-        for cost_type in CostType
-    ]
-
-    @app.template_filter("currency")
-    def format_currency(value: Optional[Decimal]) -> str:
-        if value is None:
-            return "—"
-        return f"${value:,.2f}"
-
-    @app.template_filter("decimal")
-    def format_decimal(value: Optional[Decimal]) -> str:
-        if value is None:
-            return "—"
-        return f"{value:,.2f}"
-
-    def _default_cost_row() -> Dict[str, str]:
-        return {
-            "vendor": "",
-            "name": "",
-            "cost_type": CostType.OPERATIONAL.value,
-            "amount": "",
-            "notes": "",
-        }
-
-    def _parse_int(value: str, field: str, errors: List[str], default: int = 0) -> int:
+    # The bundled template uses the calculator's precomputed *_str values; the filters remain
+    # for custom templates.
+    app.add_template_filter(format_currency, "currency")
+    app.add_template_filter(format_decimal, "decimal")
+
+    # Outside debug mode the template is resolved once (after the filters are registered) and
+    # rendered directly, skipping Flask's per-request lookup. Debug mode (which also turns on Jinja
+    # auto-reload) looks it up on every request so template edits show up immediately.
+    cached_template = app.jinja_env.get_template("dashboard.html")
+
+    def _dashboard_template():
+        if app.debug:
+            return app.jinja_env.get_template("dashboard.html")
+        return cached_template
+
+    def _parse_int(value: str, field: str, errors: list[str], default: int = 0) -> int:
         if not value:
             return default
-        try:
-            return int(value)
-        except ValueError:
+        parsed = _int_or_none(value)
+        if parsed is None:
             errors.append(f"{field} must be an integer.")
             return default
+        return parsed
 
     def _parse_decimal(
         value: str,
         field: str,
-        errors: List[str],
+        errors: list[str],
         default: Decimal = Decimal("0"),
     ) -> Decimal:
         if not value:
             return default
-        try:
-            return Decimal(value)
-        except (InvalidOperation, ValueError):
+        parsed = _decimal_or_none(value)
+        if parsed is None:
             errors.append(f"{field} must be a valid number.")
             return default
+        return parsed
+
+    # The GET page depends only on constants, so outside debug mode it is rendered on the first
+    # request (which provides the context url_for needs) and the encoded bytes are served from then on.
+    landing_page: list[bytes] = []
+
+    def _landing_response():
+        if app.debug or not landing_page:
+            html = _dashboard_template().render(
+                cost_rows=[_DEFAULT_COST_ROW],
+                form_values=_FORM_DEFAULTS,
+                cost_type_options=_COST_TYPE_OPTIONS,
+                errors=[],
+                results=None,
+            )
+            if app.debug:
+                return app.response_class(html, mimetype="text/html")
+            landing_page.append(html.encode("utf-8"))
+        return app.response_class(landing_page[0], mimetype="text/html")
 
     @app.route("/", methods=["GET", "POST"])
     def dashboard():
-        errors: List[str] = []
-        results: Optional[Dict[str, object]] = None
-
-        form_defaults = {
-            "expected_customers": "2500",
-            "expected_transactions": "120000",
-            "customer_price": "35",
-            "transaction_price": "0.45",
-            "subscription_revenue": "0",
-            "analysis_period_months": "12",
-        }
+        if request.method != "POST":
+            return _landing_response()
+
+        # Resolve the request proxy once; every form read below goes through this local.
+        form = request.form
+
+        errors: list[str] = []
+        results: Mapping[str, object] | None = None
+
+        # The revenue fields are read straight into locals; form_values is only kept for redisplay.
+        submitted_values = tuple(map(form.get, _FORM_KEYS, _FORM_DEFAULT_VALUES))
+        (
+            customers_text,
+            transactions_text,
+            customer_price_text,
+            transaction_price_text,
+            subscription_text,
+            period_text,
+        ) = submitted_values
+        form_values = dict(zip(_FORM_KEYS, submitted_values))
+
+        cost_rows: list[_CostRow] = []
+
+        # Bucket every submitted field in one pass, then walk the cost columns in lockstep. Rows
+        # are driven by the vendor column; shorter columns are padded with their defaults.
+        columns = dict(form.lists())
+        vendors = columns.get("cost_vendor", [])
+        submitted_rows = itertools.islice(
+            itertools.zip_longest(
+                vendors,
+                columns.get("cost_type", []),
+                columns.get("cost_name", []),
+                columns.get("cost_amount", []),
+                columns.get("cost_notes", []),
+            ),
+            len(vendors),
+        )
 
-        form_values = {key: request.form.get(key, default) for key, default in form_defaults.items()}
-
-        cost_rows: List[Dict[str, str]] = []
-        if request.method == "POST":
-            vendors = request.form.getlist("cost_vendor")
-            types = request.form.getlist("cost_type")
-            names = request.form.getlist("cost_name")
-            amounts = request.form.getlist("cost_amount")
-            notes_list = request.form.getlist("cost_notes")
-
-            cost_items: List[CostItem] = []
-
-            for idx, vendor in enumerate(vendors):
-                row = {
-                    "vendor": vendor,
-                    "cost_type": types[idx] if idx < len(types) else CostType.OPERATIONAL.value,
-                    "name": names[idx] if idx < len(names) else "",
-                    "amount": amounts[idx] if idx < len(amounts) else "",
-                    "notes": notes_list[idx] if idx < len(notes_list) else "",
-                }
-                cost_rows.append(row)
-
-                if not any(value.strip() for value in (row["vendor"], row["name"], row["amount"])):
-                    continue
+        # Only the fields that affect the results are collected; they also form the cache key.
+        cost_entries: list[tuple[CostType, Decimal]] = []
+        cacheable = all(len(text) <= _CACHEABLE_LENGTH for text in submitted_values)
+
+        for vendor, cost_type_value, name, amount, notes in submitted_rows:
+            # The form redisplays every row, so keep the raw values in a light tuple rather than
+            # a dict per row.
+            row = _CostRow(
+                vendor,
+                _DEFAULT_COST_ROW.cost_type if cost_type_value is None else cost_type_value,
+                name or "",
+                amount or "",
+                notes or "",
+            )
+            cost_rows.append(row)
 
-                if not row["vendor"].strip():
-                    errors.append("Each cost entry must include a vendor name.")
-                    continue
+            # Strip each field once; the raw values are kept in ``row`` for redisplay.
+            vendor_text = vendor.strip()
+            name_text = row.name.strip()
+            amount_text = row.amount.strip()
 
-                if not row["name"].strip():
-                    errors.append("Each cost entry must include a cost description.")
-                    continue
+            if not (vendor_text or name_text or amount_text):
+                continue
 
-                if not row["amount"].strip():
-                    errors.append(f"An amount is required for {row['vendor']} - {row['name']}.")
-                    continue
+            if not vendor_text:
+                errors.append("Each cost entry must include a vendor name.")
+                continue
 
+            if not name_text:
+                errors.append("Each cost entry must include a cost description.")
+                continue
+
+            if not amount_text:
+                errors.append(f"An amount is required for {row.vendor} - {row.name}.")
+                continue
+
+            # Values posted from the <select> are exact enum values; anything else (hand-built
+            # requests, older clients) goes through the normalising parser.
+            cost_type = _COST_TYPE_BY_VALUE.get(row.cost_type)
+            if cost_type is None:
                 try:
-                    cost_type = CostType.from_string(row["cost_type"])
+                    cost_type = CostType.from_string(row.cost_type)
                 except ValueError:
-                    errors.append(f"Unknown cost type for vendor {row['vendor']}.")
+                    errors.append(f"Unknown cost type for vendor {row.vendor}.")
                     continue
 
-                before_errors = len(errors)
-                amount_value = _parse_decimal(
-                    row["amount"], f"Amount for {row['vendor']} - {row['name']}", errors
-                )
-                if len(errors) > before_errors:
-                    continue
-
-                cost_items.append(
-                    CostItem(
-                        name=row["name"].strip(),
-                        cost_type=cost_type,
-                        amount=amount_value,
-                        notes=row["notes"].strip() or None,
-                    )
-                )
-
-            expected_customers = _parse_int(form_values["expected_customers"], "Expected customers", errors)
-            expected_transactions = _parse_int(form_values["expected_transactions"], "Expected transactions", errors)
-            customer_price = _parse_decimal(form_values["customer_price"], "Customer price", errors)
-            transaction_price = _parse_decimal(form_values["transaction_price"], "Transaction price", errors)
-            subscription_revenue = _parse_decimal(form_values["subscription_revenue"], "Subscription revenue", errors)
-            analysis_period = _parse_int(form_values["analysis_period_months"], "Analysis period", errors, default=12)
-
-            revenue_inputs = RevenueInputs(
-                analysis_period_months=analysis_period,
-                expected_customers=expected_customers,
-                expected_transactions=expected_transactions,
-                customer_price=customer_price,
-                transaction_price=transaction_price,
-                subscription_revenue=subscription_revenue,
+            before_errors = len(errors)
+            amount_value = _parse_decimal(
+                amount_text, f"Amount for {row.vendor} - {row.name}", errors
             )
+            if len(errors) > before_errors:
+                continue
+
+            cost_entries.append((cost_type, amount_value))
+            if len(amount_text) > _CACHEABLE_LENGTH:
+                cacheable = False
+
+        expected_customers = _parse_int(customers_text, "Expected customers", errors)
+        expected_transactions = _parse_int(transactions_text, "Expected transactions", errors)
+        customer_price = _parse_decimal(customer_price_text, "Customer price", errors)
+        transaction_price = _parse_decimal(transaction_price_text, "Transaction price", errors)
+        subscription_revenue = _parse_decimal(subscription_text, "Subscription revenue", errors)
+        analysis_period = _parse_int(period_text, "Analysis period", errors, default=12)
+
+        revenue_inputs = RevenueInputs(
+            analysis_period_months=analysis_period,
+            expected_customers=expected_customers,
+            expected_transactions=expected_transactions,
+            customer_price=customer_price,
+            transaction_price=transaction_price,
+            subscription_revenue=subscription_revenue,
+        )
 
-            if not errors:
-                calculator = BreakEvenCalculator(cost_items, revenue_inputs)
-                summary = calculator.summary()
-                profitability = calculator.profitability_projection()
-                results = {
-                    "summary": summary,
-                    "break_even_customers": calculator.break_even_customers(),
-                    "break_even_transactions": calculator.break_even_transactions(),
-                    "required_customer_price": calculator.required_customer_price(),
-                    "required_transaction_price": calculator.required_transaction_price(),
-                    "profitability": profitability,
-                    "revenue_inputs": revenue_inputs,
-                    "cost_count": len(cost_items),
-                }
+        if not errors:
+            if cacheable and len(cost_entries) <= _CACHEABLE_ROWS:
+                results = _cached_dashboard_results(tuple(cost_entries), revenue_inputs)
+            else:
+                results = _dashboard_results(tuple(cost_entries), revenue_inputs)
 
         if not cost_rows:
-            cost_rows.append(_default_cost_row())
+            cost_rows.append(_DEFAULT_COST_ROW)
 
-        return render_template(
-            "dashboard.html",
+        return _dashboard_template().render(
             cost_rows=cost_rows,
             form_values=form_values,
-            cost_type_options=cost_type_options,
+            cost_type_options=_COST_TYPE_OPTIONS,
             errors=errors,
             results=results,
         )
 
+    # Byte-for-byte what jsonify({"status": "ok"}) produces, encoded once.
+    health_body = b'{"status":"ok"}\n'
+
     @app.route("/healthz")
     def healthcheck():
-        return {"status": "ok"}
+        # A fresh Response per probe (it is mutable and may be touched by after_request hooks),
+        # but the JSON body is never re-encoded.
+        return app.response_class(health_body, mimetype="application/json")
 
     return app
 
 
-def main(argv: Optional[Iterable[str]] = None) -> None:
+def main(argv: Iterable[str] | None = None) -> None:
     parser = argparse.ArgumentParser(description="Run the FastXE web dashboard")
     parser.add_argument("--host", default="127.0.0.1", help="Hostname to bind the development server to")
     parser.add_argument("--port", type=int, default=8000, help="Port to run the development server on")
     parser.add_argument("--debug", action="store_true", help="Enable Flask debug mode")
+    parser.add_argument(
+        "--server",
+        choices=("werkzeug", "uvicorn", "gevent"),
+        default="werkzeug",
+        help="Server used to host the app: the Werkzeug development server (default), uvicorn via an "
+        "ASGI bridge, or gevent's cooperative WSGI server for concurrent requests.",
+    )
     args = parser.parse_args(list(argv) if argv is not None else None)
 
-    app = create_app()
-    app.run(host=args.host, port=args.port, debug=args.debug)
+    if args.server == "gevent":
+        try:
+            from gevent import monkey
+            from gevent.pywsgi import WSGIServer
+        except ImportError:
+            parser.error("--server gevent requires the optional 'gevent' dependency.")
+        # Patch the standard library before the app (and any blocking I/O) is set up.
+        monkey.patch_all()
+        WSGIServer((args.host, args.port), create_app()).serve_forever()
+    elif args.server == "uvicorn":
+        try:
+            import uvicorn
+            from asgiref.wsgi import WsgiToAsgi
+        except ImportError:
+            parser.error("--server uvicorn requires the optional 'uvicorn' and 'asgiref' dependencies.")
+        uvicorn.run(WsgiToAsgi(create_app()), host=args.host, port=args.port)
+    else:
+        app = create_app()
+        app.run(host=args.host, port=args.port, debug=args.debug)
 
 
 if __name__ == "__main__":  # pragma: no cover